@@ -18,6 +18,7 @@ setuptools.setup(
     python_requires=">=3.10",
     # if you have direct dependencies, they can go here:
     install_requires=[
+        "numpy",
         "pandas>=1.5",
         # "some-other-lib>=X.Y"
     ],
@@ -2,15 +2,17 @@
 ss_roster2csv/cli.py
 
 Implements the command-line interface.
-Parses arguments (--input-file, --output-file, --debug), 
-calls the parser logic via process_roster(), and saves the final CSV.
+Parses arguments (--input-file or --input-dir, --output-file, --logging), 
+calls the parser logic via read_courses_info(), and writes the final CSV.
 """
 
 import argparse
 import logging
+import os
 import sys
 import pandas as pd
 from . import io_utils, parser
+from .mytypes import CoursesInfo
 from .logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,33 @@ def process_roster(input_path: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: The parsed roster in long-table format.
     """
+    return build_table(read_courses_info(input_path))
+
+
+def process_roster_dir(input_dir: str) -> pd.DataFrame:
+    """
+    Processes every roster PDF of a directory and returns a single DataFrame.
+
+    Args:
+        input_dir (str): Directory holding the roster PDF files.
+
+    Returns:
+        pd.DataFrame: The parsed rosters in long-table format.
+    """
+    return build_table(read_courses_info_dir(input_dir))
+
+
+def read_courses_info(input_path: str, workers: int = 1) -> CoursesInfo:
+    """
+    Extracts the (header, students) pairs of a TU roster file (PDF or text).
+
+    Args:
+        input_path (str): Path to the input roster file (.pdf or .txt).
+        workers (int): Processes used to parse the courses (see get_courses_info).
+
+    Returns:
+        CoursesInfo: The parsed (header, students) pairs.
+    """
 
     # Convert PDF if necessary
     if input_path.lower().endswith(".pdf"):
@@ -34,22 +63,66 @@ def process_roster(input_path: str) -> pd.DataFrame:
     else:
         text_path = input_path
 
-    # Read lines from the text file
-    pages = io_utils.read_roster(text_path)
-    logger.info("Loaded %d pages from %s", len(pages), text_path)
+    return read_text_courses_info(text_path, workers)
 
-    # Build the list of 'courses'
+
+def read_courses_info_dir(input_dir: str, workers: int = 1) -> CoursesInfo:
+    """
+    Extracts the (header, students) pairs of every roster PDF of a directory.
+
+    The PDFs are converted to text concurrently before being parsed.
+
+    Args:
+        input_dir (str): Directory holding the roster PDF files.
+        workers (int): Processes used to parse the courses (see get_courses_info).
+
+    Returns:
+        CoursesInfo: The parsed (header, students) pairs of all the rosters.
+    """
+    pdf_paths = sorted(
+        os.path.join(input_dir, name)
+        for name in os.listdir(input_dir)
+        if name.lower().endswith(".pdf")
+    )
+    if not pdf_paths:
+        raise FileNotFoundError(f"No PDF roster found in {input_dir}")
+
+    logger.info("Found %d PDFs in %s", len(pdf_paths), input_dir)
+    text_paths = io_utils.convert_pdfs_to_text(pdf_paths)
+
+    crs_data: CoursesInfo = []
+    for text_path in text_paths:
+        crs_data.extend(read_text_courses_info(text_path, workers))
+    return crs_data
+
+
+def read_text_courses_info(text_path: str, workers: int = 1) -> CoursesInfo:
+    """
+    Extracts the (header, students) pairs of a roster text file.
+
+    Args:
+        text_path (str): Path to the roster text file (as made by pdftotext).
+        workers (int): Processes used to parse the courses (see get_courses_info).
+
+    Returns:
+        CoursesInfo: The parsed (header, students) pairs.
+    """
+    # Stream the pages of the text file into the list of 'courses'
+    pages = io_utils.iter_pages(text_path)
     courses = parser.find_course_pages(pages)
     logger.info("Extracted %d courses", len(courses))
 
     # Extract (header, students) pairs
-    crs_data = parser.get_courses_info(courses)
+    crs_data = parser.get_courses_info(courses, workers)
     logger.info("Extracted headers & student data for %d courses", len(crs_data))
 
-    # Build the final DataFrame
+    return crs_data
+
+
+def build_table(crs_data: CoursesInfo) -> pd.DataFrame:
+    """Builds the final DataFrame from (header, students) pairs."""
     df = parser.build_long_table(crs_data)
     logger.info("Final DataFrame with %d rows", len(df))
-
     return df
 
 
@@ -58,15 +131,27 @@ def main():
     parser_cli = argparse.ArgumentParser(
         description="Convert a TU roster PDF or text file into CSV."
     )
-    parser_cli.add_argument(
+    input_group = parser_cli.add_mutually_exclusive_group(required=True)
+    input_group.add_argument(
         "--input-file",
         "-i",
-        required=True,
         help="Path to the input PDF or text file (roster).",
     )
+    input_group.add_argument(
+        "--input-dir",
+        "-d",
+        help="Directory of roster PDFs, converted in parallel into one CSV.",
+    )
     parser_cli.add_argument(
         "--output-file", "-o", required=True, help="Path to the resulting CSV file."
     )
+    parser_cli.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Processes used to parse very large rosters (default: 1).",
+    )
     parser_cli.add_argument(
         "--logging",
         "-l",
@@ -80,9 +165,14 @@ def main():
     setup_logging(args.error_level)
 
     try:
-        df = process_roster(args.input_file)
-        df.to_csv(args.output_file, index=False)
-        logger.info("Roster saved to: %s", args.output_file)
+        if args.input_dir:
+            crs_data = read_courses_info_dir(args.input_dir, args.jobs)
+        else:
+            crs_data = read_courses_info(args.input_file, args.jobs)
+
+        # rows are streamed to the CSV, no DataFrame is built here
+        n_rows = parser.write_rows_csv(args.output_file, crs_data)
+        logger.info("Roster saved to: %s (%d rows)", args.output_file, n_rows)
 
     except Exception as e:
         logger.error("Failed to process roster: %s", e)
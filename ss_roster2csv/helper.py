@@ -115,11 +115,19 @@ def get_instructors_crdata(crdata):
 
 
 def get_course_by_code(course_code, courses):
-    return [(i, c) for i, c in enumerate(courses) if course_code in c][0]
+    found = next(((i, c) for i, c in enumerate(courses) if course_code in c), None)
+    if found is None:
+        raise IndexError(f"No course matching {course_code}")
+    return found
 
 
 def get_crdata_by_code(course_code, crdata):
-    return [(i, c) for i, c in enumerate(crdata) if course_code in c[0]["Course"]()][0]
+    found = next(
+        ((i, c) for i, c in enumerate(crdata) if course_code in c[0]["Course"]()), None
+    )
+    if found is None:
+        raise IndexError(f"No course matching {course_code}")
+    return found
 
 
 def get_instructor_courses(name, crdata):
@@ -10,11 +10,22 @@ Skips lines containing certain strings, handles formfeed, etc.
 import os
 import subprocess
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, List, TextIO, Tuple
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Lines dropped when they match exactly, or when they contain _SMART
+_IGNORE_EXACTLY = frozenset(
+    {"", "Roster", "Academic Yr.", "2024/2025", "Harper, Maryland County"}
+)
+_SMART = "Smart School"
+
+# Characters read at a time by iter_pages
+_BLOCK_SIZE = 1 << 16
+
 
 def line_of_interest(line: str) -> bool:
     """
@@ -26,24 +37,7 @@ def line_of_interest(line: str) -> bool:
     Returns:
         bool: True if the line should be kept, False otherwise.
     """
-    to_ignore_exactly = [
-        "",
-        "Roster",
-        "Academic Yr.",
-        "2024/2025",
-        "Harper, Maryland County",
-    ]
-    to_be_contained = ["Smart School"]
-
-    if line in to_ignore_exactly:
-        logger.debug(f"Ignoring exact match: '{line}'")
-        return False
-
-    if any(skip in line for skip in to_be_contained):
-        logger.debug(f"Ignoring line containing: '{line}'")
-        return False
-
-    return True
+    return line not in _IGNORE_EXACTLY and _SMART not in line
 
 
 def convert_pdf_to_text(pdf_path: str) -> str:
@@ -77,9 +71,30 @@ def convert_pdf_to_text(pdf_path: str) -> str:
         raise
 
 
+def convert_pdfs_to_text(pdf_paths: List[str]) -> List[str]:
+    """
+    Convert several PDF files to text, running one 'pdftotext' per CPU.
+
+    Args:
+        pdf_paths (List[str]): Paths to the input PDF files.
+
+    Returns:
+        List[str]: Paths to the generated text files, in input order.
+    """
+    if not pdf_paths:
+        return []
+
+    # pdftotext does the work in its own process; threads only wait on it
+    workers = min(len(pdf_paths), os.cpu_count() or 1)
+    logger.info(f"Converting {len(pdf_paths)} PDFs with {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(convert_pdf_to_text, pdf_paths))
+
+
 def read_roster(text_file: str = "roster_250303.txt") -> List[List[str]]:
     """
-    Reads a text file line by line, extracting pages while skipping unwanted content.
+    Reads a text file and splits it on formfeeds into pages, skipping unwanted content.
 
     Args:
         text_file (str): The path to the roster text file.
@@ -87,42 +102,65 @@ def read_roster(text_file: str = "roster_250303.txt") -> List[List[str]]:
     Returns:
         List[List[str]]: A list of pages, where each page is a list of lines.
     """
+    return list(iter_pages(text_file))
+
+
+def iter_pages(text_file: str) -> Iterator[List[str]]:
+    """
+    Lazily yields the pages of a roster text file, skipping unwanted content.
+
+    The file is read in blocks, so only the page being built is held in
+    memory besides the current block. A page break is a line starting
+    with a formfeed that is itself of interest; a formfeed elsewhere in a
+    line is kept as text.
+
+    Args:
+        text_file (str): The path to the roster text file.
+
+    Yields:
+        List[str]: One page at a time, as a list of lines.
+    """
     logger.info(f"Reading roster file: {text_file}")
-    
-    pages: List[List[str]] = []
-    page: List[str] = []
+
+    n_pages = 0
     total_lines = 0
     ignored_lines = 0
+    page: List[str] = []
 
     try:
         with open(text_file, "r") as f:
-            for line in f:
-                total_lines += 1
-                line = line.rstrip("\n")
+            for text, after_break in _iter_chunks(f):
+                lines = text.split("\n")
 
-                if line_of_interest(line):
-                    if line.startswith("\x0c"):  # Page break detected
+                if after_break:
+                    total_lines += 1
+                    if line_of_interest("\x0c" + lines[0]):
+                        # Page break: ignore it and any attached header text
                         if page:
-                            pages.append(page)
-                            logger.info(f"Page {len(pages)} added with {len(page)} lines.")
+                            n_pages += 1
+                            logger.info(f"Page {n_pages} added with {len(page)} lines.")
+                            yield page
                             page = []
+                    else:
+                        ignored_lines += 1
+                    lines = lines[1:]
 
-                        # Ignore the page break itself and any attached header text
-                        continue
-
-                    page.append(line.strip(':'))  # we strip ':' from all and daytime
-                else:
-                    ignored_lines += 1
+                total_lines += len(lines)
+                # we strip ':' from all and daytime
+                kept = [line.strip(":") for line in lines if line_of_interest(line)]
+                ignored_lines += len(lines) - len(kept)
+                page.extend(kept)
 
         # Add the last page if not empty
         if page:
-            pages.append(page)
-            logger.info(f"Final page {len(pages)} added with {len(page)} lines.")
-
-        logger.info(f"Finished reading file: {total_lines} lines processed, {ignored_lines} ignored.")
-        logger.info(f"Total pages extracted: {len(pages)}")
+            n_pages += 1
+            logger.info(f"Final page {n_pages} added with {len(page)} lines.")
+            yield page
 
-        return pages
+        logger.info(
+            f"Finished reading file: {total_lines} lines processed, {ignored_lines} ignored."
+        )
+        logger.info(f"Total pages extracted: {n_pages}")
 
     except FileNotFoundError:
         logger.error(f"Roster file not found: {text_file}")
@@ -132,3 +170,30 @@ def read_roster(text_file: str = "roster_250303.txt") -> List[List[str]]:
         logger.error(f"Unexpected error while reading roster: {e}")
         raise
 
+
+def _iter_chunks(f: TextIO) -> Iterator[Tuple[str, bool]]:
+    """
+    Splits an open text file at every formfeed that starts a line.
+
+    Yields (text, after_break) pairs, after_break telling whether the text
+    follows such a formfeed (the rest of its line is then the first line
+    of text). Pieces of a chunk are kept in a list and joined once.
+    """
+    pending: List[str] = []
+    after_break = False
+    last = "\n"  # character preceding the next piece
+
+    for block in iter(partial(f.read, _BLOCK_SIZE), ""):
+        for j, part in enumerate(block.split("\x0c")):
+            if j:
+                if last == "\n":
+                    yield "".join(pending), after_break
+                    pending, after_break = [], True
+                else:
+                    pending.append("\x0c")
+                last = "\x0c"
+            if part:
+                pending.append(part)
+                last = part[-1]
+
+    yield "".join(pending), after_break
@@ -1,4 +1,4 @@
-from typing import Tuple, TypeAlias, TypedDict, Literal, List
+from typing import Any, Tuple, TypeAlias, TypedDict, Literal, List, Mapping
 
 
 class CrsHeader(TypedDict, total=False):
@@ -17,8 +17,9 @@ Pages: TypeAlias = List[Page]
 Course: TypeAlias = List[str]
 Courses: TypeAlias = List[Course]
 StudentData: TypeAlias = Tuple[str, str, str]
-CrsData: TypeAlias = Tuple[List[str], List[StudentData]]
 HeaderInfo: TypeAlias = List[str]
 BodyInfo: TypeAlias = List[str]
-CourseInfo: TypeAlias = Tuple[HeaderInfo, Students]
+# parsed header (see parse_header_keys) with the course's students
+CourseInfo: TypeAlias = Tuple[Mapping[str, Any], Students]
 CoursesInfo: TypeAlias = List[CourseInfo]
+CrsData: TypeAlias = CoursesInfo
@@ -7,10 +7,16 @@ Contains the main functional parsing logic:
  - Building the DataFrame
 """
 
+import csv
 import logging
+import os
+import numpy as np
 import pandas as pd
 import re
-from typing import List, Tuple, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import List, Tuple, Dict, Any, Iterable, Sequence
+from .logging_config import setup_logging
 from .mytypes import (
     CrsHeader,
     Student,
@@ -38,40 +44,78 @@ COURSE_HEADER_KEYS = [
     "Day/Time",
 ]
 STUD_HEADER = ["StudentID", "Full Name", "Cell #", "Email"]
+_COURSE_HEADER_SET = frozenset(COURSE_HEADER_KEYS)
+
+# Parsing a course takes tens of microseconds, so process start-up and
+# pickling only pay off on rosters of thousands of courses; the pool is
+# also opt-in (see get_courses_info).
+PARALLEL_MIN_COURSES = 2000
+
+# Column names of the long table
+LONG_TABLE_RENAMES = {
+    "Course Title": "course_title",
+    "Instructor": "instructor",
+    "Section": "section",
+    "LineNo": "lineno",
+    "StudentID": "studid",
+    "FullName": "fullname",
+}
+_DAYTIME_RE = re.compile(r"(?P<days>^[^ ]*) (?P<time>.*)")
+_COURSE_CODE_RE = re.compile(r"(?P<course_code>^[^ ]*) (?P<course_no>.*)")
+
+# Word lexer for student records, compiled once. The alternatives are
+# tried in order: a whole-word TU id, a whole-word line number, else the
+# leading non-digit part of the word as a name piece.
+_STUDENT_LEX = re.compile(
+    r"(?P<tuid>(?:TU-)?\d{5})$|(?P<rid>\d{1,2})$|(?P<name>\D+)"
+)
+
+# '+' only shows up in phone numbers: dropping it before matching lets a
+# name simply run up to the next digit.
+_STRIP_TABLE = str.maketrans("", "", "+")
 
 
-def find_course_pages(pages: Pages) -> Courses:
+def find_course_pages(pages: Iterable[Page]) -> Courses:
     """
     Merge pages into 'courses' by accumulating pages until 'Total' is found.
 
+    Pages are consumed one at a time, so a generator such as
+    io_utils.iter_pages can be passed without materializing the file.
+
     Args:
-        pages (Pages): A list of pages (each page is a list of text lines).
+        pages (Iterable[Page]): Pages, each page being a list of text lines.
 
     Returns:
         Courses: A list of parsed course records.
     """
     courses: Courses = []
     course: Course = []
+    n_pages = 0
 
     for idx, page in enumerate(pages):
         empty_page = False
+        start = 0
 
-        if course:
-            if "Email" not in page:
+        if n_pages:
+            try:
+                start = page.index("Email") + 1
+            except ValueError:
                 logger.warning(f"Page {idx} lacks 'Email', possible corruption: {page}")
             else:
-                sidx = page.index("Email")
-                page = page[sidx + 1 :]
-                empty_page = len(page) == 0
+                empty_page = start == len(page)
 
-        course.append(page)
+        # continuation pages are appended past their repeated header
+        course.extend(islice(page, start, None))
+        n_pages += 1
 
-        if "Total" in page or empty_page:
+        if "Total" in islice(page, start, None) or empty_page:
+            assert n_pages in [1, 2], f"Unexpected page count: {n_pages}"
             courses.append(course)
-            logger.info(f"Processed course {len(courses)} with {len(course)} pages.")
+            logger.info(f"Processed course {len(courses)} with {n_pages} pages.")
             course = []
+            n_pages = 0
 
-    return [make_one(c) for c in courses]
+    return courses
 
 
 def make_one(course: Courses) -> Course:
@@ -85,40 +129,52 @@ def make_one(course: Courses) -> Course:
         Course: A single merged list of lines.
     """
     assert len(course) in [0, 1, 2], f"Unexpected page count: {len(course)}"
-    return (
-        course[0] + course[1]
-        if len(course) == 2
-        else course[0] if len(course) == 1 else []
-    )
+    return list(chain.from_iterable(course))
 
 
-def get_courses_info(courses: Courses) -> CoursesInfo:
+def get_courses_info(courses: Courses, workers: int = 1) -> CoursesInfo:
     """
     Extracts header and student information from courses.
 
     Args:
         courses (Courses): A list of parsed course pages.
+        workers (int): Number of processes to parse with. A pool is only
+            started when this is above 1 and there are at least
+            PARALLEL_MIN_COURSES courses; otherwise parsing is serial.
 
     Returns:
         CoursesInfo: A list of (header, student records) tuples.
     """
-    result: CoursesInfo = []
-
-    for i, course in enumerate(courses):
-        if "Email" not in course:
-            logger.warning(f"Course {i} missing 'Email', skipping student extraction.")
-            result.append((course, []))
-            continue
-
-        header, body = split_head_body(course)
-        hdr_dict = parse_header_keys(header)
-        students = get_lonely_students(body) if len(body) < 5 else get_students(body)
-        result.append((hdr_dict, students))
-        logger.info(
-            f"Parsed course {i, hdr_dict['Course']}: {len(students)} students extracted."
+    if workers <= 1 or len(courses) < PARALLEL_MIN_COURSES:
+        return [_parse_one_course(i, course) for i, course in enumerate(courses)]
+
+    # Courses are independent. Workers get the parent's log level, since
+    # under 'spawn' they never run the CLI's setup_logging.
+    level = logging.getLevelName(logging.getLogger().getEffectiveLevel())
+    chunksize = max(1, len(courses) // (4 * workers))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=setup_logging, initargs=(level,)
+    ) as executor:
+        return list(
+            executor.map(
+                _parse_one_course, range(len(courses)), courses, chunksize=chunksize
+            )
         )
 
-    return result
+
+def _parse_one_course(i: int, course: Course) -> CourseInfo:
+    """Extracts the (header, students) pair of the i-th course."""
+    if "Email" not in course:
+        logger.warning(f"Course {i} missing 'Email', skipping student extraction.")
+        return (course, [])
+
+    header, body = split_head_body(course)
+    hdr_dict = parse_header_keys(header)
+    students = get_students(body)
+    logger.info(
+        f"Parsed course {i, hdr_dict['Course']}: {len(students)} students extracted."
+    )
+    return (hdr_dict, students)
 
 
 def split_head_body(course: Course) -> Tuple[HeaderInfo, BodyInfo]:
@@ -131,21 +187,29 @@ def split_head_body(course: Course) -> Tuple[HeaderInfo, BodyInfo]:
     Returns:
         Tuple[HeaderInfo, BodyInfo]: Header and student body data.
     """
-    if "StudentID" not in course:
+    # one left-to-right pass records the three markers
+    head_eidx = stud_sidx = stud_eidx = -1
+    for idx, tok in enumerate(course):
+        if tok == "StudentID":
+            if head_eidx < 0:
+                head_eidx = idx
+        elif tok == "Email":
+            if stud_sidx < 0:
+                stud_sidx = idx
+        elif tok == "Total" and stud_eidx < 0:
+            stud_eidx = idx
+            if head_eidx >= 0 and stud_sidx >= 0:
+                break
+
+    if head_eidx < 0:
         logger.warning(f"Missing 'StudentID' in course: {course}")
         return course, []
 
-    head_eidx = course.index("StudentID")
-
-    if "Email" not in course:
+    if stud_sidx < 0:
         logger.warning(f"Missing 'Email' after 'StudentID' in course: {course}")
         return course[:head_eidx], []
 
-    stud_sidx = course.index("Email")
-
-    try:
-        stud_eidx = course.index("Total")
-    except ValueError:
+    if stud_eidx < 0:
         stud_eidx = len(course)
 
     return course[:head_eidx], course[stud_sidx + 1 : stud_eidx]
@@ -155,32 +219,26 @@ def get_lonely_students(body: BodyInfo) -> Students:
     """
     Handles cases where only one student is listed.
 
+    get_students handles a record without line number itself, this is
+    kept for existing callers.
+
     Args:
         body (BodyInfo): The student record as a single block.
 
     Returns:
         Students: A single student record or an empty list.
     """
-    if not body:
-        return []
-
-    assert len(body) < 5, f"Expected <=4 tokens, found: {body}"
-    student_text = " ".join(body)
-    tuid = r"((?:TU-)?(?<!\d)\d{5})"
-    name = r"([^\d+]+)"
-    student_pat = f"\\s*{tuid}\\s+{name}"
-
-    match = re.match(student_pat, student_text)
-    if not match:
-        logger.warning(f"Could not extract lonely student: {student_text}")
-        return []
-
-    return [tuple([1] + list(match.groups()))]
+    return get_students(body)
 
 
 def get_students(body: BodyInfo) -> Students:
     """
-    Extracts multiple students from the given body text.
+    Extracts students from the given body text.
+
+    A record is a line number, a TU id and the name words up to the first
+    digit. A TU id that is the very first word of the body and has no line
+    number before it (lonely students, whose '1' ends up in the header)
+    gets line number 1.
 
     Args:
         body (BodyInfo): Flattened student records.
@@ -188,18 +246,39 @@ def get_students(body: BodyInfo) -> Students:
     Returns:
         Students: A list of parsed student records.
     """
-    student_text = " ".join(body)
-    tuid = r"((?:TU-)?(?<!\d)\d{5})"
-    name = r"([^\d+]+)"
-    rid = r"((?<!\d)\d{1,2})"
-    student_pat = f"\\s*{rid}\\s+{tuid}\\s+{name}"
+    records: List[Tuple[Any, str, List[str]]] = []
+    lineno = None
+    in_name = False
+    first_word = True
+
+    for token in body:
+        for word in token.translate(_STRIP_TABLE).split():
+            match = _STUDENT_LEX.match(word)
+            kind = match.lastgroup if match else None
+            leading, first_word = first_word, False
+
+            if kind == "rid":
+                lineno, in_name = word, False
+            elif kind == "tuid" and (lineno is not None or leading):
+                name_parts: List[str] = []
+                records.append((lineno if lineno is not None else 1, word, name_parts))
+                lineno, in_name = None, True
+            elif match is not None and kind == "name" and in_name:
+                name_parts.append(match.group("name"))
+                in_name = match.end() == len(word)
+            else:
+                lineno, in_name = None, False
 
     students: Students = []
     last_lineno = 1
 
-    for match in re.finditer(student_pat, student_text):
-        lineno, tu_id, stud_name = match.groups()
-        cur_lineno = is_number(lineno)
+    for lineno, tu_id, name_parts in records:
+        if not name_parts:
+            continue
+
+        stud_name = " ".join(name_parts)
+        # the lexer only lets decimal digits through, int() cannot fail
+        cur_lineno = int(lineno)
 
         if students and cur_lineno != last_lineno + 1:
             logger.warning(
@@ -210,6 +289,9 @@ def get_students(body: BodyInfo) -> Students:
         students.append((lineno, tu_id, stud_name))
         logger.info(f"Student extracted: {tu_id} | {stud_name}")
 
+    if body and not students:
+        logger.warning(f"Could not extract students from: {body}")
+
     return students
 
 
@@ -223,35 +305,54 @@ def build_long_table(crs: CrsData) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A structured DataFrame representation.
     """
-    rows = []
-
-    for i, (header, students) in enumerate(crs):
-        hdr_dict = header
-        hdr_dict["crsno"] = i
+    lead_keys, late_keys = _header_keys(crs)
+    hdr_cols: Dict[str, List[Any]] = {k: [] for k in lead_keys + late_keys}
+    crsnos: List[int] = []
+    linenos: List[Any] = []
+    sids: List[str] = []
+    names: List[str] = []
 
-        for student in students:
-            if len(student) != 3:
-                logger.warning(f"Malformed student entry: {student}")
-                continue
+    hdr_items = list(hdr_cols.items())
 
-            row = {
-                **hdr_dict,
-                "LineNo": student[0],
-                "StudentID": student[1],
-                "FullName": student[2],
-            }
-            rows.append(row)
+    for i, (header, students) in enumerate(crs):
+        valid = _valid_students(students)
+        n_students = len(valid)
+        if not n_students:
+            continue
 
-    rs = pd.DataFrame(rows)
+        # one extend per column and per course, no per-student writes
+        c_linenos, c_sids, c_names = zip(*valid)
+        linenos.extend(c_linenos)
+        sids.extend(c_sids)
+        names.extend(c_names)
+        for key, col in hdr_items:
+            col.extend([header.get(key, "")] * n_students)
+        crsnos.extend([i] * n_students)
+
+    # dtypes are given upfront so pandas has nothing to infer
+    rs = pd.DataFrame(
+        {
+            **{k: np.asarray(hdr_cols[k], dtype=object) for k in lead_keys},
+            "crsno": np.asarray(crsnos, dtype="i4"),
+            # Student allows a missing line number: keep it as <NA>
+            "LineNo": pd.array(
+                [None if n is None else int(n) for n in linenos], dtype="Int32"
+            ),
+            # object, not a fixed-width string dtype that would truncate ids
+            "StudentID": np.asarray(sids, dtype=object),
+            "FullName": np.asarray(names, dtype=object),
+            **{k: np.asarray(hdr_cols[k], dtype=object) for k in late_keys},
+        }
+    )
 
     # splitint the Day/Time in 2 based on space
     rs = pd.concat(
-        [rs, rs["Day/Time"].str.extract("(?P<days>^[^ ]*) (?P<time>.*)")], axis=1
+        [rs, rs["Day/Time"].str.extract(_DAYTIME_RE.pattern)], axis=1
     ).drop(columns="Day/Time")
 
     # splitting Course in Course code and Couse no
     rs = pd.concat(
-        [rs, rs["Course"].str.extract("(?P<course_code>^[^ ]*) (?P<course_no>.*)")],
+        [rs, rs["Course"].str.extract(_COURSE_CODE_RE.pattern)],
         axis=1,
     )
     # add a course id != course no
@@ -260,20 +361,102 @@ def build_long_table(crs: CrsData) -> pd.DataFrame:
     )
     rs = rs.drop(columns="Course")
 
-    rs = rs.rename(
-        columns={
-            "Course Title": "course_title",
-            "Instructor": "instructor",
-            "Section": "section",
-            "LineNo": "lineno",
-            "StudentID": "studid",
-            "FullName": "fullname",
-        }
-    )
+    rs = rs.rename(columns=LONG_TABLE_RENAMES)
 
     return rs
 
 
+def write_rows_csv(path: str, crs: CrsData) -> int:
+    """
+    Writes extracted courses straight to a CSV file, one row per student.
+
+    The columns are the same as those of build_long_table, but no DataFrame
+    is built: header-derived values are computed once per course.
+
+    Args:
+        path (str): Path of the CSV file to write.
+        crs (CrsData): List of (header, students) tuples.
+
+    Returns:
+        int: The number of student rows written.
+    """
+    lead_keys, late_keys = (
+        [k for k in keys if k not in ("Day/Time", "Course")] for keys in _header_keys(crs)
+    )
+    columns = [
+        LONG_TABLE_RENAMES.get(k, k)
+        for k in lead_keys + ["crsno", "LineNo", "StudentID", "FullName"] + late_keys
+    ] + ["days", "time", "course_code", "course_no", "crsid"]
+    n_rows = 0
+
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(columns)
+
+        for i, (header, students) in enumerate(crs):
+            valid = _valid_students(students)
+            if not valid:
+                continue
+
+            course = header.get("Course", "")
+            daytime = _DAYTIME_RE.match(header.get("Day/Time", ""))
+            code = _COURSE_CODE_RE.match(course)
+            section = header.get("Section", "")
+
+            lead_vals = [header.get(k, "") for k in lead_keys]
+            late_vals = [header.get(k, "") for k in late_keys]
+            derived = [
+                *(daytime.groups() if daytime else ("", "")),
+                *(code.groups() if code else ("", "")),
+                f"{course.replace(' ', '_')}-s{section:0>2}",
+            ]
+            writer.writerows(
+                [*lead_vals, i, *student, *late_vals, *derived] for student in valid
+            )
+            n_rows += len(valid)
+
+    return n_rows
+
+
+def _header_keys(crs: CrsData) -> Tuple[List[str], List[str]]:
+    """
+    Header keys of the courses that contribute rows, in long-table order.
+
+    This mirrors how pandas orders the columns of a list of row dicts: the
+    keys of the first row (its header keys, then crsno, LineNo, StudentID
+    and FullName) followed by keys first seen in later rows.
+
+    Args:
+        crs (CrsData): List of (header, students) tuples.
+
+    Returns:
+        Tuple[List[str], List[str]]: Keys of the first contributing course,
+        and the keys first seen after it, both in first-seen order.
+    """
+    lead_keys: List[str] = []
+    late_keys: Dict[str, None] = {}
+    first = True
+    for header, students in crs:
+        if not any(len(student) == 3 for student in students):
+            continue
+        if first:
+            lead_keys, first = list(header), False
+        else:
+            late_keys.update(dict.fromkeys(k for k in header if k not in lead_keys))
+    return lead_keys, list(late_keys)
+
+
+def _valid_students(students: Iterable[Sequence[Any]]) -> List[Sequence[Any]]:
+    """Drops (with a warning) student entries that are not 3-tuples."""
+    valid = []
+    for student in students:
+        if len(student) != 3:
+            logger.warning(f"Malformed student entry: {student}")
+            continue
+        valid.append(student)
+    return valid
+
+
 def parse_header_keys(tokens: HeaderInfo) -> CrsHeader:
     """
     Extracts header key-value pairs from tokens.
@@ -289,11 +472,11 @@ def parse_header_keys(tokens: HeaderInfo) -> CrsHeader:
 
     for i in range(len(tokens)):
         key = tokens[i]
-        if key in COURSE_HEADER_KEYS and key not in used_keys:
+        if key in _COURSE_HEADER_SET and key not in used_keys:
             used_keys.add(key)
             value = (
                 tokens[i + 1]
-                if i + 1 < len(tokens) and tokens[i + 1] not in COURSE_HEADER_KEYS
+                if i + 1 < len(tokens) and tokens[i + 1] not in _COURSE_HEADER_SET
                 else ""
             )
             # We want to do a special treatment for Day/Time key because some courses with only
@@ -323,7 +506,6 @@ def is_number(value: str) -> Any:
     Returns:
         Any: Parsed number or None.
     """
-    try:
-        return int(value)
-    except ValueError:
-        return None
+    # isdecimal() only accepts what int() accepts, so no exception is raised
+    digits = value[1:] if value.startswith("-") else value
+    return int(value) if digits.isdecimal() else None
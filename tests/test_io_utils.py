@@ -18,3 +18,28 @@ def test_read_roster_simple(tmp_path):
     assert len(pages) == 2
     assert pages[0] == ["Line 1", "Line 2"]
     assert pages[1] == ["Line 3"]
+
+
+def test_convert_pdfs_to_text_keeps_order(monkeypatch):
+    monkeypatch.setattr(io_utils, "convert_pdf_to_text", lambda p: p + ".txt")
+    paths = [f"r{i}.pdf" for i in range(5)]
+    assert io_utils.convert_pdfs_to_text(paths) == [p + ".txt" for p in paths]
+    assert io_utils.convert_pdfs_to_text([]) == []
+
+
+def test_iter_pages_is_lazy(tmp_path):
+    f = tmp_path / "pages.txt"
+    f.write_text("Line 1\n\x0cHeader\nLine 2\n\x0cHeader\nLine 3\n")
+    pages = io_utils.iter_pages(str(f))
+    assert next(pages) == ["Line 1"]
+    assert list(pages) == [["Line 2"], ["Line 3"]]
+
+
+def test_read_roster_page_break_rules(tmp_path):
+    f = tmp_path / "breaks.txt"
+    f.write_text(
+        "Line 1\n\x0cSmart School page header\nLine 2\nA\x0cB\n\x0cHeader\nLine 3\n"
+    )
+    pages = io_utils.read_roster(str(f))
+    # an ignored formfeed line and a mid-line formfeed do not break the page
+    assert pages == [["Line 1", "Line 2", "A\x0cB"], ["Line 3"]]
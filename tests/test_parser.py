@@ -86,6 +86,25 @@ def test_get_courses_info(mock_courses):
     assert isinstance(courses_info[0][1], list)  # Students
 
 
+def test_get_courses_info_parallel_matches_serial(monkeypatch, mock_courses):
+    """Ensure the process-pool path returns the same data, in order, as the serial one."""
+    monkeypatch.setattr(parser, "PARALLEL_MIN_COURSES", 2)
+    courses = mock_courses * 8
+    assert parser.get_courses_info(courses, workers=2) == parser.get_courses_info(courses)
+
+
+def test_get_courses_info_serial_by_default(monkeypatch, mock_courses):
+    """Ensure no pool is started unless more than one worker is asked for."""
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(parser, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(parser, "PARALLEL_MIN_COURSES", 2)
+    assert len(parser.get_courses_info(mock_courses * 8)) == 16
+    assert len(parser.get_courses_info(mock_courses * 8, workers=1)) == 16
+
+
 # ------------------------
 # Test: get_students
 # ------------------------
@@ -102,6 +121,49 @@ def test_get_students(mock_students):
     assert students[0] == ("1", "TU-12345", "John Doe")
 
 
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        # a name stops at a phone number, with or without a leading '+'
+        (
+            ["1", "TU-12345", "John Doe", "+231 770 000", "2", "TU-67890", "Jane", "0777 123"],
+            [("1", "TU-12345", "John Doe"), ("2", "TU-67890", "Jane")],
+        ),
+        # a name stops at the first digit inside a word
+        (["1", "TU-12345", "John Doe0777", "x"], [("1", "TU-12345", "John Doe")]),
+        # tokens merged by pdftotext are split back into words
+        (
+            ["1 TU-12345 John Doe", "2 TU-67890 Jane Smith"],
+            [("1", "TU-12345", "John Doe"), ("2", "TU-67890", "Jane Smith")],
+        ),
+        # a "TU-1" fragment does not make a line number
+        (["TU-1", "23456", "Jane"], []),
+        # no trailing or doubled spaces are kept in the name
+        (["1", "TU-12345", "John  Doe ", " ", "2"], [("1", "TU-12345", "John Doe")]),
+    ],
+)
+def test_get_students_words(body, expected):
+    """Ensure names are cut and words are recognized token by token."""
+    assert parser.get_students(body) == expected
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        # leading TU id without line number: the lonely-student case
+        (["TU-98765", "Solo Student"], [(1, "TU-98765", "Solo Student")]),
+        # ... also with 5 or more tokens, where len(body) < 5 used to decide
+        (["TU-98765", "Solo Student", "+231 77", "x", "y"], [(1, "TU-98765", "Solo Student")]),
+        # a TU id further in the body needs its own line number
+        (["0777123456", "54321", "O'Neil"], []),
+        (["Note", "TU-98765", "Solo Student"], []),
+    ],
+)
+def test_get_students_without_lineno(body, expected):
+    """Ensure only a TU id opening the body may come without a line number."""
+    assert parser.get_students(body) == expected
+
+
 # ------------------------
 # Test: get_lonely_students
 # ------------------------
@@ -138,6 +200,70 @@ def test_build_long_table(mock_crs_data):
     assert set(df.columns) >= {"LineNo", "StudentID", "FullName", "Course", "Semester"}
 
 
+# ------------------------
+# Test: write_rows_csv
+# ------------------------
+@pytest.fixture
+def mock_crs_headers():
+    """Fixture providing parsed course headers with their students."""
+    return [
+        (
+            {"Course": "ACCT 102", "Semester": "2", "Course Title": "Accounting",
+             "Instructor": "Dr. Smith", "Section": "1", "Day/Time": "MW 8:00-9:00"},
+            [("1", "TU-12345", "John Doe"), ("2", "TU-22345", "Jane, Roe")],
+        ),
+        (
+            {"Course": "BFIN 402", "Semester": "1", "Section": "12", "Day/Time": ""},
+            [(1, "TU-67890", "Solo Student")],
+        ),
+        ({"Course": "COMP 101", "Semester": "1"}, []),
+        # a header key first seen in a later course
+        (
+            {"Course": "MATH 101", "Section": "2", "Day/Time": "F 10:00", "Room": "B4"},
+            [("1", "TU-11111", "Ann Lee")],
+        ),
+    ]
+
+
+def test_write_rows_csv_matches_long_table(tmp_path, mock_crs_headers):
+    """Ensure the direct CSV writer produces the same file as the DataFrame path."""
+    direct = tmp_path / "direct.csv"
+    via_df = tmp_path / "via_df.csv"
+
+    n_rows = parser.write_rows_csv(str(direct), mock_crs_headers)
+    parser.build_long_table(mock_crs_headers).to_csv(via_df, index=False)
+
+    assert n_rows == 4
+    assert direct.read_text() == via_df.read_text()
+
+
+def test_build_long_table_column_order():
+    """Ensure header keys first seen in a later course come after the student columns."""
+    crs = [
+        ({"Course": "ACCT 102", "Section": "1", "Day/Time": "MW 8:00"}, [("1", "TU-12345", "John Doe")]),
+        ({"Course": "BFIN 402", "Instructor": "Dr. Smith", "Section": "2", "Day/Time": "TR 9:00"}, [("1", "TU-67890", "Jane Roe")]),
+    ]
+    df = parser.build_long_table(crs)
+    assert list(df.columns)[:6] == ["section", "crsno", "lineno", "studid", "fullname", "instructor"]
+
+
+def test_build_long_table_missing_lineno_and_long_id(tmp_path):
+    """Ensure a None line number is kept as missing and long ids are not truncated."""
+    crs = [
+        (
+            {"Course": "ACCT 102", "Section": "1", "Day/Time": "MW 8:00"},
+            [(None, "TU-12345", "John Doe"), ("2", "TU-1234567890123", "Jane Roe")],
+        )
+    ]
+    df = parser.build_long_table(crs)
+    assert df["lineno"].isna().tolist() == [True, False]
+    assert df["studid"].tolist() == ["TU-12345", "TU-1234567890123"]
+
+    direct = tmp_path / "direct.csv"
+    parser.write_rows_csv(str(direct), crs)
+    assert direct.read_text() == df.to_csv(index=False)
+
+
 # ------------------------
 # Test: parse_header_keys
 # ------------------------